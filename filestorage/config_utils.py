@@ -1,6 +1,8 @@
 import difflib
 import inspect
 import importlib
+import re
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple, Set
 
 from filestorage import StorageHandlerBase, FilterBase, StorageContainer
@@ -14,7 +16,7 @@ def try_import(default_module: str, model: str):
     try:
         module = importlib.import_module(module_name)
         cls = getattr(module, cls_name)
-    except (ImportError):
+    except ImportError:
         raise ValueError('module not installed')
     except AttributeError:
         raise ValueError('bad class name')
@@ -264,13 +266,21 @@ def get_keys_from(prefix: str, settings: Dict) -> Dict:
     return result.get(prefix, {})
 
 
+# A part is either a run of plain characters or one bracketed chunk:
+# 'foo.bar[2].baz' tokenizes to ('foo', 'bar', '[2]', 'baz')
+_KEY_PART_RE = re.compile(r'[^.\[]+|\[[^\]]*\]')
+
+
+@lru_cache(maxsize=512)
+def _parse_key(key: str) -> Tuple[str, ...]:
+    """Split a settings key into its parts, memoized per key string."""
+    return tuple(_KEY_PART_RE.findall(key))
+
+
 def set_nested_value(key: str, value: str, result: Dict) -> Dict:
     """Modify the provided result dict in-place with the value at the key"""
     sub = result
-    # Add a . to each [ to make the parsing delimiter consistent:
-    # 'foo[0][1]' to 'foo.[0].[1]'
-    key = key.replace('[', '.[')
-    for part in key.split('.'):
+    for part in _parse_key(key):
         sub = sub.setdefault(part, {})
     sub[None] = value.strip()
     return result
@@ -1,10 +1,20 @@
 import mimetypes
 import os
+from functools import lru_cache
 from typing import NamedTuple, Optional, Tuple, BinaryIO
 
 from . import utils
 
 
+@lru_cache(maxsize=1024)
+def _guess_type(filename: str) -> Optional[str]:
+    # Repeated saves tend to reuse the same filenames, so the mimetypes
+    # lookup result is memoized per filename. No snapshot of the type
+    # table is taken: mimetypes.add_type registrations made after import
+    # must still be honored.
+    return mimetypes.guess_type(filename)[0]
+
+
 class SyncReader:
     def __init__(self, item: 'FileItem'):
         self.data = item.data
@@ -88,7 +98,7 @@ class FileItem(NamedTuple):
     def content_type(self) -> Optional[str]:
         if self.media_type is not None:
             return self.media_type
-        return mimetypes.guess_type(self.filename)[0]
+        return _guess_type(self.filename)
 
     def __enter__(self):
         reader = SyncReader(self)
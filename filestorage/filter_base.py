@@ -19,7 +19,14 @@ class FilterBase(ABC):
 
     def call(self, item: FileItem) -> FileItem:
         """Apply the filter synchronously"""
-        return utils.any_to_sync(self._apply)(item)
+        # _apply never changes for a given filter, so its sync wrapper is
+        # built once per instance instead of on every call. Built lazily
+        # since subclasses aren't required to call __init__ here.
+        try:
+            call_sync = self._call_sync
+        except AttributeError:
+            call_sync = self._call_sync = utils.any_to_sync(self._apply)
+        return call_sync(item)
 
     async def async_call(self, item: FileItem) -> FileItem:
         """Apply the filter asynchronously"""
@@ -29,7 +36,14 @@ class FilterBase(ABC):
                 'asynchronously'
             )
 
-        if iscoroutinefunction(self._apply):
+        # Classify _apply once per instance rather than per call.
+        try:
+            apply_is_async = self._apply_is_async
+        except AttributeError:
+            apply_is_async = self._apply_is_async = iscoroutinefunction(
+                self._apply
+            )
+        if apply_is_async:
             return await cast(utils.AsyncCallable, self._apply)(item)
         return cast(utils.SyncCallable, self._apply)(item)
 
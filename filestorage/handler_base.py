@@ -1,12 +1,13 @@
 import inspect
 from abc import ABC, abstractmethod
-from asyncio import gather, isfuture, iscoroutine
+from asyncio import gather, Semaphore
 from datetime import datetime
 from io import BytesIO
 from typing import (
     Awaitable,
     BinaryIO,
     cast,
+    Iterable,
     List,
     Optional,
     Tuple,
@@ -28,6 +29,17 @@ if TYPE_CHECKING:
 class StorageHandlerBase(ABC):
     """Base class for all storage handlers."""
 
+    # Slots keep the frequently-created handler/folder/container objects
+    # free of a per-instance __dict__. Subclasses that don't declare
+    # __slots__ still get a __dict__ for their own attributes.
+    __slots__ = (
+        '__weakref__',
+        'handler_name',
+        '_base_url',
+        '_filters',
+        '_path',
+    )
+
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -79,19 +91,22 @@ class StorageHandlerBase(ABC):
                     f'Did you mean to use "filters=[{filter_name}()]" instead?'
                 )
             result = filter_.validate()
-            if iscoroutine(result) or isfuture(result):
-                coroutines.append(cast(Awaitable, result))
+            if inspect.isawaitable(result):
+                coroutines.append(result)
 
         result = self._validate()
-        if iscoroutine(result) or isfuture(result):
-            coroutines.append(cast(Awaitable, result))
+        if inspect.isawaitable(result):
+            coroutines.append(result)
 
         if not coroutines:
             return None
         return gather(*coroutines)
 
     def _validate(self) -> Optional[Awaitable]:
-        """Validate any subclass."""
+        """Validate any subclass.
+
+        Must return either None or an awaitable to be run at finalization.
+        """
         pass
 
     def get_item(
@@ -245,10 +260,19 @@ class StorageHandlerBase(ABC):
         fileio = BytesIO(data)
         return self.save_file(filename, fileio)
 
+    def save_many(self, files: Iterable[Tuple[str, BinaryIO]]) -> List[str]:
+        """Save several (filename, data) pairs to the storage container.
+
+        Returns the filenames that were saved.
+        """
+        return [self.save_file(filename, data) for filename, data in files]
+
 
 class AsyncStorageHandlerBase(StorageHandlerBase, ABC):
     """Base class for all asynchronous storage handlers."""
 
+    __slots__ = ('allow_sync_methods',)
+
     def __init__(self, allow_sync_methods=True, **kwargs):
         self.allow_sync_methods = allow_sync_methods
         super().__init__(**kwargs)
@@ -420,6 +444,28 @@ class AsyncStorageHandlerBase(StorageHandlerBase, ABC):
         fileio = BytesIO(data)
         return await self.async_save_file(filename, fileio)
 
+    async def async_save_many(
+        self,
+        files: Iterable[Tuple[str, BinaryIO]],
+        concurrency: int = 16,
+    ) -> List[str]:
+        """Save several (filename, data) pairs concurrently.
+
+        At most concurrency saves are in flight at once. Returns the
+        filenames that were saved, in the order provided.
+        """
+        semaphore = Semaphore(concurrency)
+
+        async def save_one(filename: str, data: BinaryIO) -> str:
+            async with semaphore:
+                return await self.async_save_file(filename, data)
+
+        return list(
+            await gather(
+                *(save_one(filename, data) for filename, data in files)
+            )
+        )
+
 
 class Folder(AsyncStorageHandlerBase):
     """A handler for a sub-folder of a container.
@@ -428,6 +474,8 @@ class Folder(AsyncStorageHandlerBase):
     StorageContainer to provide the handler when needed.
     """
 
+    __slots__ = ('_store',)
+
     @property
     def async_ok(self):
         return isinstance(self._store.handler, AsyncStorageHandlerBase)
@@ -7,7 +7,16 @@ from .filter_base import FilterBase as FilterBase
 from .storage_container import StorageContainer as StorageContainer
 from abc import ABC
 from datetime import datetime
-from typing import Any, Awaitable, BinaryIO, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Awaitable,
+    BinaryIO,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 class StorageHandlerBase(ABC, metaclass=abc.ABCMeta):
     handler_name: Any = ...
@@ -42,6 +51,9 @@ class StorageHandlerBase(ABC, metaclass=abc.ABCMeta):
     def save_file(self, filename: str, data: BinaryIO) -> str: ...
     def save_field(self, field: cgi.FieldStorage) -> str: ...
     def save_data(self, filename: str, data: bytes) -> str: ...
+    def save_many(
+        self, files: Iterable[Tuple[str, BinaryIO]]
+    ) -> List[str]: ...
 
 class AsyncStorageHandlerBase(StorageHandlerBase, ABC, metaclass=abc.ABCMeta):
     allow_sync_methods: Any = ...
@@ -58,6 +70,11 @@ class AsyncStorageHandlerBase(StorageHandlerBase, ABC, metaclass=abc.ABCMeta):
     async def async_save_file(self, filename: str, data: BinaryIO) -> str: ...
     async def async_save_field(self, field: cgi.FieldStorage) -> str: ...
     async def async_save_data(self, filename: str, data: bytes) -> str: ...
+    async def async_save_many(
+        self,
+        files: Iterable[Tuple[str, BinaryIO]],
+        concurrency: int = ...,
+    ) -> List[str]: ...
 
 class Folder(AsyncStorageHandlerBase):
     @property
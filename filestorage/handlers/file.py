@@ -1,6 +1,10 @@
 import os
+import secrets
+from asyncio import get_running_loop, to_thread
 from datetime import datetime
 from typing import Optional, Set
+from uuid import uuid4
+from weakref import WeakKeyDictionary
 
 try:
     # The aiofiles library is needed for async file operations
@@ -10,6 +14,14 @@ except ImportError:
     # The validate method will ensure this isn't None prior to use
     aiofiles = None  # type: ignore
 
+try:
+    # The optional caio library provides native async file I/O
+    # (io_uring-backed on Linux 5.1+)
+    import caio  # type: ignore
+except ImportError:
+    # Writes fall back to the aiofiles threadpool
+    caio = None  # type: ignore
+
 from filestorage import (
     FileItem,
     StorageHandlerBase,
@@ -105,20 +117,24 @@ class LocalFileHandler(StorageHandlerBase):
         return item.filename
 
     def resolve_filename(self, item: FileItem) -> FileItem:
-        """Ensures a unique name for this file in the folder"""
+        """Ensures a unique name for this file in the folder.
+
+        On collision, a short random suffix is added to the name. Unlike a
+        sequential counter this takes a constant number of probes no matter
+        how many similarly-named files already exist.
+        """
         if not self._exists(item):
             return item
 
         basename, ext = os.path.splitext(item.filename)
-        for counter in range(1, 1000000):
-            filename = f'{basename}-{counter}{ext}'
+        for _ in range(5):
+            filename = f'{basename}-{secrets.token_urlsafe(6)}{ext}'
             item = item.copy(filename=filename)
             if not self._exists(item):
                 return item
-        else:
-            raise RuntimeError(
-                f'Cannot get unique name for file {basename}{ext}'
-            )
+
+        # Vanishingly unlikely, but fall back to a full UUID
+        return item.copy(filename=f'{basename}-{uuid4()}{ext}')
 
 
 def os_wrap(fn: utils.SyncCallable) -> utils.AsyncCallable:
@@ -133,7 +149,19 @@ def disabled_method(*args, **kwargs):
 
 
 class AsyncLocalFileHandler(LocalFileHandler, AsyncStorageHandlerBase):
-    """Class for storing files locally"""
+    """Class for storing files locally.
+
+    When the caio library is installed, file writes go through its
+    io_uring-backed context, which batches submissions on a single ring
+    instead of paying a thread hop per write. Otherwise writes go through
+    the aiofiles threadpool, which is strictly slower.
+    """
+
+    # One caio context per event loop: a context binds to the loop it was
+    # created under, and successive asyncio.run calls (finalize_config
+    # among them) each bring a fresh loop. Dead loops fall out of the
+    # mapping along with their contexts.
+    _caio_contexts: 'WeakKeyDictionary' = WeakKeyDictionary()
 
     async def async_make_dir(self, item: Optional[FileItem] = None):
         """Ensures the provided path exists."""
@@ -162,12 +190,9 @@ class AsyncLocalFileHandler(LocalFileHandler, AsyncStorageHandlerBase):
         self.allow_sync_methods = temp_setting
 
     async def _async_exists(self, item: FileItem) -> bool:
-        try:
-            await aiofiles.os.stat(self.local_path(item))
-        except FileNotFoundError:
-            return False
-        else:
-            return True
+        # A single os.path.exists call in a thread is cheaper than
+        # dispatching a stat through the aiofiles wrappers.
+        return await to_thread(os.path.exists, self.local_path(item))
 
     async def _async_get_size(self, item: FileItem) -> int:
         file_stat = await aiofiles.os.stat(self.local_path(item))
@@ -199,6 +224,52 @@ class AsyncLocalFileHandler(LocalFileHandler, AsyncStorageHandlerBase):
             await self.async_make_dir(item)
 
         item = await self.async_resolve_filename(item)
+        if caio is not None:
+            await self._caio_save(item)
+        else:
+            await self._aiofiles_save(item)
+
+        return item.filename
+
+    def _get_caio_context(self):
+        loop = get_running_loop()
+        context = self._caio_contexts.get(loop)
+        if context is None:
+            context = caio.AsyncioContext(max_requests=128)
+            self._caio_contexts[loop] = context
+        return context
+
+    async def _caio_save(self, item: FileItem) -> None:
+        """Write the file through the shared caio submission context."""
+        context = self._get_caio_context()
+
+        fd = os.open(
+            self.local_path(item),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            mode=0o666,
+        )
+        try:
+            offset = 0
+            async with item as f:
+                while True:
+                    chunk = await f.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    # The kernel is free to write fewer bytes than asked;
+                    # keep submitting the remainder.
+                    while chunk:
+                        written = await context.write(chunk, fd, offset)
+                        if not written:
+                            raise OSError(
+                                f'short write saving {item.filename!r}'
+                            )
+                        offset += written
+                        chunk = chunk[written:]
+        finally:
+            os.close(fd)
+
+    async def _aiofiles_save(self, item: FileItem) -> None:
+        """Write the file through the aiofiles threadpool."""
         open_context = aiofiles.open(self.local_path(item), 'wb')
         async with open_context as destination:  # type: ignore
             async with item as f:
@@ -208,23 +279,25 @@ class AsyncLocalFileHandler(LocalFileHandler, AsyncStorageHandlerBase):
                         break
                     await destination.write(chunk)
 
-        return item.filename
-
     async def async_resolve_filename(self, item: FileItem) -> FileItem:
-        """Ensures a unique name for this file in the folder"""
+        """Ensures a unique name for this file in the folder.
+
+        On collision, a short random suffix is added to the name. Unlike a
+        sequential counter this takes a constant number of probes no matter
+        how many similarly-named files already exist.
+        """
         if not await self._async_exists(item):
             return item
 
         basename, ext = os.path.splitext(item.filename)
-        for counter in range(1, 1000000):
-            filename = f'{basename}-{counter}{ext}'
+        for _ in range(5):
+            filename = f'{basename}-{secrets.token_urlsafe(6)}{ext}'
             item = item.copy(filename=filename)
             if not await self._async_exists(item):
                 return item
-        else:
-            raise RuntimeError(
-                f'Cannot get unique name for file {basename}{ext}'
-            )
+
+        # Vanishingly unlikely, but fall back to a full UUID
+        return item.copy(filename=f'{basename}-{uuid4()}{ext}')
 
     def _save(self, item: FileItem) -> str:
         if not self.allow_sync_methods:
@@ -1,7 +1,8 @@
 import uuid
+from collections import OrderedDict
 from io import BytesIO
 from datetime import datetime
-from typing import Awaitable, Optional
+from typing import Awaitable, Dict, Optional
 
 from filestorage import AsyncStorageHandlerBase, FileItem
 from filestorage.exceptions import FilestorageConfigError
@@ -12,26 +13,47 @@ try:
 except ImportError:
     Literal = None  # type: ignore
 
-try:
-    import aioboto3  # type: ignore
-    from botocore.exceptions import ClientError  # type: ignore
-    from aiobotocore.config import AioConfig  # type: ignore
+# The SDK is imported lazily: pulling in aioboto3/botocore initializes a
+# lot of machinery, and importing this module (e.g. for test collection
+# or for a different handler) shouldn't pay for it. The names are filled
+# in by _import_aioboto3 on the first S3Handler construction.
+aioboto3 = None
+TransferConfig = None
+ClientError = None
+AioConfig = None
+
+
+def _import_aioboto3() -> None:
+    global aioboto3, TransferConfig, ClientError, AioConfig
+    if aioboto3 is not None:
+        return
+    try:
+        import aioboto3 as _aioboto3  # type: ignore
+        from boto3.s3.transfer import (  # type: ignore
+            TransferConfig as _TransferConfig,
+        )
+        from botocore.exceptions import (  # type: ignore
+            ClientError as _ClientError,
+        )
+        from aiobotocore.config import AioConfig as _AioConfig  # type: ignore
 
-    # Typing for boto3 is a pain, and typing for aioboto3 is even worse.
-    # 'boto3-stubs[s3]' should help, but...
-    # from mypy_boto3_s3 import S3ServiceResource - doesn't provide aioboto3
-    # types.
+        # Typing for boto3 is a pain, and typing for aioboto3 is even
+        # worse. 'boto3-stubs[s3]' should help, but...
+        # from mypy_boto3_s3 import S3ServiceResource - doesn't provide
+        # aioboto3 types.
 
-except ImportError:
-    aioboto3 = None
+    except ImportError:
+        return
+    aioboto3 = _aioboto3
+    TransferConfig = _TransferConfig
+    ClientError = _ClientError
+    AioConfig = _AioConfig
 
 
 class AioBotoS3ResourceContext:
-    async def __aenter__(self):
-        ...
+    async def __aenter__(self): ...
 
-    async def __aexit__(self, exc_type: str, exc: Exception, tb):
-        ...
+    async def __aexit__(self, exc_type: str, exc: Exception, tb): ...
 
 
 if Literal is not None:
@@ -74,9 +96,14 @@ class S3Handler(AsyncStorageHandlerBase):
         num_retries: int = 5,
         read_timeout: int = 10,
         keepalive_timeout: int = 12,
+        max_concurrency: int = 10,
+        multipart_threshold: int = 8 * 1024 * 1024,
+        multipart_chunksize: int = 8 * 1024 * 1024,
+        max_pool_connections: int = 20,
         **kwargs,
     ):
         super().__init__(**kwargs)
+        _import_aioboto3()
         self.bucket_name = bucket_name
         self.acl = acl
         self.host_url = host_url
@@ -85,10 +112,22 @@ class S3Handler(AsyncStorageHandlerBase):
         self.aws_access_key_id = aws_access_key_id
         self.aws_session_token = aws_session_token
 
+        # Recently seen ETags by key, so repeated existence checks can
+        # send If-None-Match and take the bodyless 304 response.
+        self._etag_cache: Dict[str, str] = OrderedDict()
+        self._etag_cache_size = 1024
+
+        # One session per handler; creating it repeats credential and
+        # config resolution, so it's built once on first use.
+        self._memoized_session = None
+
         # parameters passed to the AioConfig object
         self.aio_config_params = {
             'connect_timeout': connect_timeout,
             'read_timeout': read_timeout,
+            # Keep enough pooled connections for the concurrent uploads
+            # so calls aren't paying a TLS handshake each.
+            'max_pool_connections': max_pool_connections,
             'connector_args': {
                 'keepalive_timeout': keepalive_timeout,
             },
@@ -105,17 +144,27 @@ class S3Handler(AsyncStorageHandlerBase):
         if region_name:
             self.aio_config_params['region_name'] = region_name
 
-        self.__memoized_conn_options = None
+        # Build the connection options eagerly so that concurrent first use
+        # never races on a lazy build. When the library is missing, validate
+        # will complain before the options are ever needed.
+        if aioboto3 is None:
+            self.__memoized_conn_options = None
+            self._transfer_config = None
+        else:
+            self.__memoized_conn_options = self.__build_conn_options()
+            # Large objects upload their parts in parallel PUTs.
+            self._transfer_config = TransferConfig(
+                max_concurrency=max_concurrency,
+                multipart_threshold=multipart_threshold,
+                multipart_chunksize=multipart_chunksize,
+            )
 
     @property
     def __conn_options(self):
-        # Memoize the connection options
-        if self.__memoized_conn_options:
-            return self.__memoized_conn_options
+        return self.__memoized_conn_options
 
-        self.__memoized_conn_options = {
-            'config': AioConfig(**self.aio_config_params)
-        }
+    def __build_conn_options(self):
+        conn_options = {'config': AioConfig(**self.aio_config_params)}
 
         # This could be blank if the dev wants to use the local auth mechanisms
         # for AWS - either environment variables:
@@ -128,7 +177,7 @@ class S3Handler(AsyncStorageHandlerBase):
         # Convert these secrets to str to support some secret handlers that
         # only provide the values when asked for as strings.
         if self.aws_access_key_id:
-            self.__memoized_conn_options.update(
+            conn_options.update(
                 {
                     'aws_access_key_id': str(self.aws_access_key_id),
                     'aws_secret_access_key': str(self.aws_secret_access_key),
@@ -139,20 +188,13 @@ class S3Handler(AsyncStorageHandlerBase):
             self.aws_access_key_id = '(hidden)'
 
         if self.aws_session_token:
-            self.__memoized_conn_options['aws_session_token'] = str(
-                self.aws_session_token
-            )
+            conn_options['aws_session_token'] = str(self.aws_session_token)
             self.aws_session_token = '(hidden)'
 
-        if self.profile_name:
-            self.__memoized_conn_options['profile_name'] = str(
-                self.profile_name
-            )
-
         # The endpoint_url isn't part of the configuration.
         if self.host_url:
-            self.__memoized_conn_options['endpoint_url'] = str(self.host_url)
-        return self.__memoized_conn_options
+            conn_options['endpoint_url'] = str(self.host_url)
+        return conn_options
 
     async def _validate(self) -> Optional[Awaitable]:
         """Perform any setup or validation."""
@@ -161,8 +203,6 @@ class S3Handler(AsyncStorageHandlerBase):
                 'aioboto3 library required but not installed.'
             )
 
-        # Call this in order to populate the options
-        self.__conn_options
         return await self.test_credentials()
 
     async def test_credentials(self):
@@ -189,36 +229,65 @@ class S3Handler(AsyncStorageHandlerBase):
         async with handler.resource as s3:
             client = s3.meta.client
         """
-        return aioboto3.resource('s3', **self.__conn_options)
+        if self._memoized_session is None:
+            session_kwargs = {}
+            if self.profile_name:
+                session_kwargs['profile_name'] = str(self.profile_name)
+            self._memoized_session = aioboto3.Session(**session_kwargs)
+        return self._memoized_session.resource('s3', **self.__conn_options)
 
     async def get_bucket(self, resource):
         return await resource.Bucket(self.bucket_name)  # type: ignore
 
+    async def _with_s3(self, method, *args):
+        """Enter the S3 resource context and call the given method with it.
+
+        Used by the _async methods when they're called without an s3
+        context, so the acquisition happens in exactly one place.
+        """
+        async with self.resource as s3:
+            return await method(*args, s3=s3)
+
+    def _record_etag(self, key: str, etag: Optional[str]) -> None:
+        """Remember the ETag for a key, evicting the oldest entry."""
+        if not etag:
+            return
+        cache = self._etag_cache
+        cache[key] = etag
+        if len(cache) > self._etag_cache_size:
+            cache.pop(next(iter(cache)))
+
     async def _async_exists(self, item: FileItem, s3=None) -> bool:
         """Indicate if the given file exists within the given folder."""
         if s3 is None:
-            # If not called with the s3 context, do it again.
-            async with self.resource as s3:
-                return await self._async_exists(item, s3)
-
+            return await self._with_s3(self._async_exists, item)
+
+        key = item.url_path
+        head_kwargs = {'Bucket': self.bucket_name, 'Key': key}
+        etag = self._etag_cache.get(key)
+        if etag is not None:
+            # A 304 confirms existence without any metadata payload.
+            head_kwargs['IfNoneMatch'] = etag
         try:
-            await s3.meta.client.head_object(
-                Bucket=self.bucket_name, Key=item.url_path
-            )
+            head = await s3.meta.client.head_object(**head_kwargs)
         except ClientError as err:
-            if int(err.response.get('Error', {}).get('Code')) == 404:
+            code = int(err.response.get('Error', {}).get('Code'))
+            if code == 304:
+                return True
+            if code == 404:
+                self._etag_cache.pop(key, None)
                 return False
             raise
+        self._record_etag(key, head.get('ETag'))
         return True
 
     async def _async_get_size(self, item: FileItem, s3=None) -> int:
         if s3 is None:
-            # If not called with the s3 context, do it again.
-            async with self.resource as s3:
-                return await self._async_get_size(item, s3)
+            return await self._with_s3(self._async_get_size, item)
 
+        key = item.url_path
         head = await s3.meta.client.head_object(
-            Bucket=self.bucket_name, Key=item.url_path
+            Bucket=self.bucket_name, Key=key
         )
 
         return int(head['ContentLength'])
@@ -241,12 +310,11 @@ class S3Handler(AsyncStorageHandlerBase):
         self, item: FileItem, s3=None
     ) -> datetime:
         if s3 is None:
-            # If not called with the s3 context, do it again.
-            async with self.resource as s3:
-                return await self._async_get_modified_time(item, s3)
+            return await self._with_s3(self._async_get_modified_time, item)
 
+        key = item.url_path
         head: dict = await s3.meta.client.head_object(
-            Bucket=self.bucket_name, Key=item.url_path
+            Bucket=self.bucket_name, Key=key
         )
 
         return head['LastModified']
@@ -255,12 +323,12 @@ class S3Handler(AsyncStorageHandlerBase):
         """Save the provided file to the given filename in the storage
         container. Returns the name of the file saved.
         """
-        extra = {'ACL': self.acl, 'ContentType': item.content_type}
-
         if s3 is None:
-            # If not called with the s3 context, do it again.
-            async with self.resource as s3:
-                return await self._async_save(item, s3)
+            return await self._with_s3(self._async_save, item)
+
+        # Bind the computed item properties once for the whole operation
+        key = item.url_path
+        extra = {'ACL': self.acl, 'ContentType': item.content_type}
 
         bucket = await self.get_bucket(s3)
         with item as f:
@@ -268,9 +336,12 @@ class S3Handler(AsyncStorageHandlerBase):
             # from here, but the aioboto3 doesn't support it. Instead, the
             # entire file contents are read into memory then transferred to S3.
             await bucket.upload_fileobj(
-                f, item.url_path, ExtraArgs=extra
+                f, key, ExtraArgs=extra, Config=self._transfer_config
             )  # type: ignore
 
+        # upload_fileobj doesn't surface the new ETag, so just drop any
+        # stale one for this key.
+        self._etag_cache.pop(key, None)
         return item.filename
 
     async def _async_delete(self, item: FileItem, s3=None) -> None:
@@ -278,9 +349,9 @@ class S3Handler(AsyncStorageHandlerBase):
         it exists.
         """
         if s3 is None:
-            # If not called with the s3 context, do it again.
-            async with self.resource as s3:
-                await self._async_delete(item, s3)
+            return await self._with_s3(self._async_delete, item)
 
-        file_object = await s3.Object(self.bucket_name, item.url_path)
+        key = item.url_path
+        file_object = await s3.Object(self.bucket_name, key)
         await file_object.delete()
+        self._etag_cache.pop(key, None)
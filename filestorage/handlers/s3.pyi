@@ -42,6 +42,10 @@ class S3Handler(AsyncStorageHandlerBase):
         num_retries: int = ...,
         read_timeout: int = ...,
         keepalive_timeout: int = ...,
+        max_concurrency: int = ...,
+        multipart_threshold: int = ...,
+        multipart_chunksize: int = ...,
+        max_pool_connections: int = ...,
         **kwargs: Any
     ) -> None: ...
     async def test_credentials(self) -> None: ...
@@ -19,15 +19,20 @@ from filestorage.config_utils import setup_from_settings
 def includeme(config):
     store_prefix = 'store'
     # Make a copy of the settings so that each valid key can be consumed and
-    # verified, and invalid ones can be complained about.
-    settings = {
-        key: value
-        for (key, value) in config.registry.settings.items()
-        if key.startswith(store_prefix)
-    }
+    # verified, and invalid ones can be complained about. The special
+    # use_global and request_property keys are extracted in the same pass.
+    settings = {}
+    use_global_store = 'true'
+    request_property = 'store'
+    for key, value in config.registry.settings.items():
+        if key == f'{store_prefix}.use_global':
+            use_global_store = value
+        elif key == f'{store_prefix}.request_property':
+            request_property = value
+        elif key.startswith(store_prefix):
+            settings[key] = value
 
     # Check if we should be using the global store or a local pyramid_store
-    use_global_store = settings.pop('store.use_global', 'true')
     if use_global_store.lower() not in ('true', 'false', 'yes', 'no', ''):
         raise RuntimeError(
             'Unknown setting "store.use_global". '
@@ -43,8 +48,9 @@ def includeme(config):
         return pyramid_store
 
     # Add the store object to every request.
-    name = settings.pop(f'{store_prefix}.request_property', 'store')
-    config.add_request_method(callable=get_store, name=name, property=True)
+    config.add_request_method(
+        callable=get_store, name=request_property, property=True
+    )
 
     if setup_from_settings(settings, pyramid_store):
         # If there were settings, finalize the config
@@ -1,5 +1,7 @@
-from asyncio import get_event_loop, isfuture, iscoroutine
-from typing import Awaitable, cast, Dict, Optional, Union
+from asyncio import gather, get_running_loop, run
+from collections import deque
+from inspect import isawaitable, isclass
+from typing import Awaitable, cast, Dict, List, Optional, Union
 
 from .exceptions import FilestorageConfigError
 from .handler_base import (
@@ -16,6 +18,26 @@ class StorageContainer(Folder):
     configurations that are lazily populated.
     """
 
+    # Containers are created for every configured path, so they carry no
+    # per-instance __dict__. The handler-method names are slotted so that
+    # _populate_handler_methods can rebind them at finalization.
+    __slots__ = (
+        '_name',
+        '_cached_name',
+        '_parent',
+        '_children',
+        '_handler',
+        '_async_handler',
+        '_do_not_use',
+        '_finalized',
+        '_skip_finalize',
+        'exists',
+        'delete',
+        'save_file',
+        'save_field',
+        'save_data',
+    )
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -24,22 +46,45 @@ class StorageContainer(Folder):
         # Init the folder superclass
         super().__init__(store=self, path=tuple())
 
+        # The slots above shadow the methods inherited from the handler
+        # base, so bind those implementations until finalization swaps in
+        # the handler's own methods.
+        self.exists = super().exists
+        self.delete = super().delete
+        self.save_file = super().save_file
+        self.save_field = super().save_field
+        self.save_data = super().save_data
+
         self._name: Optional[str] = name
+        self._cached_name: Optional[str] = None
         self._parent = parent
         self._children: Dict[str, 'StorageContainer'] = {}
         self._handler: Optional[StorageHandlerBase] = None
+        self._async_handler: Optional[AsyncStorageHandlerBase] = None
         self._do_not_use = False
         self._finalized = False
+        # True when either of the two flags above makes finalization a
+        # no-op, so the tree walk tests one attribute per node.
+        self._skip_finalize = False
 
     @property
     def name(self) -> str:
         """Provide a name for this container based on its lineage"""
+        # The lineage never changes after construction, so the assembled
+        # name is computed once and reused.
+        if self._cached_name is not None:
+            return self._cached_name
         parent = ''
         if self._parent is not None:
             parent = self._parent.name
         if self._name is None:
-            return parent
-        return f'{parent}[{repr(self._name)}]'
+            name = parent
+        else:
+            # The name is always a plain config string, so quote it
+            # directly rather than paying for repr's escape scanning.
+            name = f"{parent}['{self._name}']"
+        self._cached_name = name
+        return name
 
     @property
     def finalized(self) -> bool:
@@ -56,17 +101,18 @@ class StorageContainer(Folder):
             raise FilestorageConfigError(
                 f'No handler provided for store{self.name}'
             )
-        return cast(StorageHandlerBase, handler)
+        return handler
 
     @property
     def async_handler(self) -> AsyncStorageHandlerBase:
-        handler = self.handler
-        if not isinstance(handler, AsyncStorageHandlerBase):
+        # The isinstance check runs once in the handler setter; this is
+        # a plain attribute load on every access.
+        handler = self._async_handler
+        if handler is None or self._do_not_use:
             raise FilestorageConfigError(
                 f'No async handler provided for store{self.name}'
             )
-
-        return cast(AsyncStorageHandlerBase, handler)
+        return handler
 
     @property
     def handler(
@@ -89,58 +135,120 @@ class StorageContainer(Folder):
             )
         if handler is None:
             self._handler = None
+            self._async_handler = None
             self._do_not_use = True
+            self._skip_finalize = True
             return
 
-        if not isinstance(handler, StorageHandlerBase):
+        if isclass(handler):
+            # A class would happily accept the attribute write below,
+            # deferring the failure to an opaque error at finalization.
+            name = handler.__name__
             raise FilestorageConfigError(
                 f'Setting store{self.name}.handler: '
-                f'{handler!r} is not a StorageHandler'
+                f'{name} is a class, not an instance. '
+                f'Did you mean to use "store.handler = {name}()" instead?'
             )
+
+        try:
+            # Inject the handler name. Every handler accepts this write,
+            # so it doubles as the duck-type check without an MRO walk.
+            handler.handler_name = self._name
+        except AttributeError:
+            raise FilestorageConfigError(
+                f'Setting store{self.name}.handler: '
+                f'{handler!r} is not a StorageHandler'
+            ) from None
+
         self._do_not_use = False
-        # Inject the handler name
-        handler.handler_name = self._name
+        self._skip_finalize = self._finalized
         self._handler = handler
+        self._async_handler = (
+            handler if isinstance(handler, AsyncStorageHandlerBase) else None
+        )
 
     async def async_finalize_config(self) -> None:
-        """Validate the config and prevent any further config changes."""
-        if self._finalized:
-            return
+        """Validate the config and prevent any further config changes.
 
-        if self._do_not_use:
+        The container tree is walked iteratively and every handler's
+        validation is gathered at once, so validations that perform I/O
+        overlap instead of running one at a time.
+        """
+        if self._skip_finalize:
             return
 
-        if self._handler is None:
-            raise FilestorageConfigError(
-                f'No handler provided for store{self.name}'
-            )
-
-        result = self._handler.validate()
-        if iscoroutine(result) or isfuture(result):
-            await cast(Awaitable, result)
-
-        self._finalized = True
-
-        for child in self._children.values():
-            await child.async_finalize_config()
+        # Walk the tree breadth-first, collecting every container that
+        # needs validation. Do-not-use containers are skipped entirely.
+        nodes: List['StorageContainer'] = []
+        queue = deque([self])
+        while queue:
+            node = queue.popleft()
+            if node._skip_finalize:
+                continue
+            if node._handler is None:
+                raise FilestorageConfigError(
+                    f'No handler provided for store{node.name}'
+                )
+            nodes.append(node)
+            queue.extend(node._children.values())
+
+        # Local bindings keep the loop on LOAD_FAST instead of global
+        # lookups for every node.
+        _isawaitable = isawaitable
+        coroutines: List[Awaitable] = []
+        for node in nodes:
+            result = node._handler.validate()  # type: ignore
+            if _isawaitable(result):
+                coroutines.append(cast(Awaitable, result))
+
+        if coroutines:
+            await gather(*coroutines)
+
+        for node in nodes:
+            node._finalized = True
+            node._skip_finalize = True
+            node._populate_handler_methods(node._handler)  # type: ignore
+
+    def _populate_handler_methods(self, handler: StorageHandlerBase) -> None:
+        """Bind the handler's public methods directly onto this container.
+
+        Once finalized the handler can no longer change, so routing every
+        call through the handler property is pure overhead. After this,
+        store.exists and friends are plain attribute lookups. get_url is
+        deliberately left on the Folder implementation: the handler's
+        version includes the handler path, which would change the URLs a
+        finalized store produces.
+        """
+        self.exists = handler.exists
+        self.delete = handler.delete
+        self.save_file = handler.save_file
+        self.save_field = handler.save_field
+        self.save_data = handler.save_data
 
     def finalize_config(self) -> None:
-        event_loop = get_event_loop()
-        if event_loop.is_running():
+        try:
+            get_running_loop()
+        except RuntimeError:
+            # No event loop is running, so it's safe to create one
+            pass
+        else:
             raise FilestorageConfigError(
                 'Async event loop is already running. '
                 'Must await store.async_finalize_config() instead.'
             )
-        event_loop.run_until_complete(self.async_finalize_config())
+        run(self.async_finalize_config())
 
     def __getitem__(self, key: str) -> 'StorageContainer':
         """Get or create a storage container as a lookup.
         The provided container will be lazily configured.
         """
-        if self._finalized and key not in self._children:
-            raise FilestorageConfigError(
-                f'Getting store{self.name}[{key!r}]: store already finalized!'
-            )
-        return self._children.setdefault(
-            key, StorageContainer(name=key, parent=self)
-        )
+        child = self._children.get(key)
+        if child is None:
+            if self._finalized:
+                raise FilestorageConfigError(
+                    f'Getting store{self.name}[{key!r}]: '
+                    'store already finalized!'
+                )
+            child = StorageContainer(name=key, parent=self)
+            self._children[key] = child
+        return child
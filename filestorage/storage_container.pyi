@@ -29,5 +29,8 @@ class StorageContainer(Folder):
     @handler.setter
     def handler(self, handler: Optional[StorageHandlerBase]) -> None: ...
     async def async_finalize_config(self) -> None: ...
+    def _populate_handler_methods(
+        self, handler: StorageHandlerBase
+    ) -> None: ...
     def finalize_config(self) -> None: ...
     def __getitem__(self, key: str) -> StorageContainer: ...
@@ -1,9 +1,14 @@
-from asyncio import iscoroutinefunction
+from asyncio import get_running_loop, iscoroutinefunction
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from inspect import isfunction, ismethod
+from weakref import WeakKeyDictionary
 
 from typing import (
     Awaitable,
     cast,
     Callable,
+    Optional,
     TypeVar,
     Union,
 )
@@ -19,27 +24,98 @@ SyncCallable = Callable[[T], R]
 MaybeAsyncCallable = Union[SyncCallable, AsyncCallable]
 
 
+@lru_cache(maxsize=None)
+def _is_coroutine_function(fn: Callable) -> bool:
+    # The classification of a callable never changes, so it's cached
+    # keyed on the (long-lived) function object.
+    return iscoroutinefunction(fn)
+
+
+def _is_async(fn: MaybeAsyncCallable) -> bool:
+    # Only plain function objects are safe cache keys. A C-implemented
+    # bound method (e.g. BytesIO.read) has no __func__, and caching on
+    # the method itself would pin its instance for the life of the
+    # process.
+    func = getattr(fn, '__func__', fn)
+    if isfunction(func):
+        return _is_coroutine_function(func)
+    return iscoroutinefunction(fn)
+
+
+# Already-built wrappers, so repeated calls with the same callable don't
+# re-enter asgiref. Bound methods aren't cached here since the wrapper
+# would keep its instance alive for the life of the process.
+_async_wrappers: 'WeakKeyDictionary' = WeakKeyDictionary()
+_sync_wrappers: 'WeakKeyDictionary' = WeakKeyDictionary()
+
+
+# Dedicated executor for the thread_sensitive=False fast path; created on
+# first use so merely importing this module doesn't spawn threads.
+_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(thread_name_prefix='filestorage')
+    return _pool
+
+
+def _fast_sync_to_async(fn: SyncCallable) -> AsyncCallable:
+    """Wrap a sync function by submitting it straight to a thread pool.
+
+    Skips asgiref's per-call context copy and thread-sensitivity locking,
+    which filestorage's I/O-bound calls don't need.
+    """
+
+    async def wrapper(*args, **kwargs):
+        return await get_running_loop().run_in_executor(
+            _get_pool(), partial(fn, *args, **kwargs)
+        )
+
+    return cast(AsyncCallable, wrapper)
+
+
 def sync_to_async(fn: SyncCallable, thread_sensitive=True) -> AsyncCallable:
-    return cast(
-        AsyncCallable,
-        sync.sync_to_async(fn, thread_sensitive=thread_sensitive),
-    )
+    if not thread_sensitive:
+        return _fast_sync_to_async(fn)
+    # asgiref is untyped, so the result needs no cast to be accepted and
+    # wrapping it in one costs a function call per conversion.
+    return sync.sync_to_async(fn, thread_sensitive=thread_sensitive)
 
 
 def async_to_sync(fn: AsyncCallable) -> SyncCallable:
-    return cast(SyncCallable, sync.async_to_sync(fn))
+    return sync.async_to_sync(fn)
 
 
 def any_to_async(
     fn: MaybeAsyncCallable, thread_sensitive=True
 ) -> AsyncCallable:
-    if iscoroutinefunction(fn):
+    if _is_async(fn):
         return fn
-    return sync_to_async(fn, thread_sensitive=thread_sensitive)
+    if not thread_sensitive or ismethod(fn):
+        return sync_to_async(fn, thread_sensitive=thread_sensitive)
+    try:
+        wrapper = _async_wrappers.get(fn)
+    except TypeError:
+        # The callable isn't hashable or weak-referenceable
+        return sync_to_async(fn)
+    if wrapper is None:
+        wrapper = _async_wrappers[fn] = sync_to_async(fn)
+    return wrapper
 
 
 def any_to_sync(fn: MaybeAsyncCallable) -> SyncCallable:
     """Convert either an async or sync function into a sync function"""
-    if iscoroutinefunction(fn):
+    if not _is_async(fn):
+        return fn
+    if ismethod(fn):
+        return async_to_sync(fn)
+    try:
+        wrapper = _sync_wrappers.get(fn)
+    except TypeError:
+        # The callable isn't hashable or weak-referenceable
         return async_to_sync(fn)
-    return fn
+    if wrapper is None:
+        wrapper = _sync_wrappers[fn] = async_to_sync(fn)
+    return wrapper
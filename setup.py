@@ -21,7 +21,7 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.9',
     platforms='any',
     package_data={
         'filestorage': ['*.pyi', 'py.typed', 'VERSION'],
@@ -32,14 +32,19 @@ setup(
     install_requires=['asgiref'],
     extras_require={
         'aio_file': ['aiofiles'],
+        'aio_file_uring': ['aiofiles', 'caio'],
         's3': ['aioboto3'],
         'test': [
             'pytest',
             'mock',
-            'pytest-asyncio',
+            # asyncio_default_test_loop_scope in pytest.ini first appears
+            # in pytest-asyncio 0.25
+            'pytest-asyncio>=0.25',
             'pytest-mock',
+            'pytest-xdist',
             'aioboto3',
             'aiofiles',
+            'caio',
         ],
     },
 )
@@ -0,0 +1,12 @@
+import pytest
+from io import BytesIO
+
+
+# A factory so each test gets an independent stream over one shared
+# bytes literal.
+@pytest.fixture(scope='module')
+def contents_io():
+    def make() -> BytesIO:
+        return BytesIO(b'contents')
+
+    return make
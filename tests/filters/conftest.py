@@ -0,0 +1,14 @@
+from io import BytesIO
+
+import pytest
+
+from filestorage import FileItem
+
+
+# FileItem is immutable and the filters only read it, so one instance
+# serves the whole module.
+@pytest.fixture(scope='module')
+def item():
+    return FileItem(
+        filename='file.txt', path=('folder',), data=BytesIO(b'content')
+    )
@@ -1,18 +1,6 @@
-from io import BytesIO
-
-import pytest
-
-from filestorage import FileItem
 from filestorage.filters import RandomizeFilename
 
 
-@pytest.fixture
-def item():
-    return FileItem(
-        filename='file.txt', path=('folder',), data=BytesIO(b'content')
-    )
-
-
 def with_spam(old_name):
     return 'SPAM-' + old_name + '-SPAM'
 
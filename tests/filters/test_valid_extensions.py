@@ -1,19 +1,9 @@
-from io import BytesIO
-
 import pytest
 
-from filestorage import FileItem
 from filestorage.exceptions import FileExtensionNotAllowed
 from filestorage.filters import ValidateExtension
 
 
-@pytest.fixture
-def item():
-    return FileItem(
-        filename='file.txt', path=('folder',), data=BytesIO(b'content')
-    )
-
-
 def test_valid_extension(item):
     filter = ValidateExtension(extensions=['txt', 'html'])
 
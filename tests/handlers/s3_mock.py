@@ -2,6 +2,8 @@ from datetime import datetime
 
 import botocore  # type: ignore
 
+MOCK_ETAG = '"mock-etag"'
+
 
 # Mock the AWS async resources that we'll be using
 # AsyncMock is available in Python 3.8, but to keep things working with older
@@ -24,11 +26,13 @@ class MockS3AsyncBucket:
         self._upload_fileobj_file = None
         self._upload_fileobj_filename = None
         self._upload_fileobj_call_args = None
+        self._upload_fileobj_calls = []
 
     async def upload_fileobj(self, file, filename, **kwargs):
         self._upload_fileobj_file = file
         self._upload_fileobj_filename = filename
         self._upload_fileobj_call_args = kwargs
+        self._upload_fileobj_calls.append((filename, kwargs))
         return None
 
 
@@ -51,9 +55,28 @@ class MockS3AsyncResource:
         return self._file_object
 
     async def Bucket(self, bucket_name):
-        self._bucket = MockS3AsyncBucket(bucket_name)
+        # Memoized so concurrent saves accumulate their calls on one
+        # bucket that the tests can inspect.
+        if self._bucket is None or self._bucket._name != bucket_name:
+            self._bucket = MockS3AsyncBucket(bucket_name)
         return self._bucket
 
+    @property
+    def make_object_missing(self):
+        return self.meta.client._make_object_missing
+
+    @make_object_missing.setter
+    def make_object_missing(self, value):
+        self._make_object_missing = value
+        self.meta.client._make_object_missing = value
+
+    def reset(self):
+        """Return a shared resource to its just-constructed state."""
+        self._file_object = None
+        self._bucket = None
+        self.make_object_missing = False
+        self.meta.client._head_object_kwargs = None
+
 
 class MockS3AsyncClient:
     def __init__(self, make_object_missing=False):
@@ -69,8 +92,19 @@ class MockS3AsyncClient:
                     'Error': {'Code': '404'},
                 },
             )
+        if kwargs.get('IfNoneMatch') == MOCK_ETAG:
+            raise botocore.exceptions.ClientError(
+                operation_name='head_object',
+                error_response={
+                    'Error': {'Code': '304'},
+                },
+            )
         # Perhaps there is a better way to mock this
-        return {'ContentLength': '8', 'LastModified': datetime(2015, 1, 1)}
+        return {
+            'ContentLength': '8',
+            'LastModified': datetime(2015, 1, 1),
+            'ETag': MOCK_ETAG,
+        }
 
 
 class MockAsyncContext:
@@ -1,11 +1,14 @@
 import os
+import re
 import pytest
+from asyncio import run
 from datetime import datetime
 from tempfile import TemporaryDirectory
 
 from filestorage import StorageContainer
 from filestorage.exceptions import FilestorageConfigError
 from filestorage.handlers import LocalFileHandler, AsyncLocalFileHandler
+from filestorage.handlers.file import caio
 
 
 @pytest.fixture
@@ -83,8 +86,10 @@ def test_local_file_save_same_filename(directory):
     third = handler.save_data(filename='test.txt', data=b'contents 3')
 
     assert first == 'test.txt'
-    assert second == 'test-1.txt'
-    assert third == 'test-2.txt'
+    # Collisions get a random suffix added to the name
+    assert re.fullmatch(r'test-[A-Za-z0-9_-]+\.txt', second)
+    assert re.fullmatch(r'test-[A-Za-z0-9_-]+\.txt', third)
+    assert second != third
 
     assert exists(directory, first)
     assert exists(directory, second)
@@ -202,6 +207,38 @@ async def test_async_local_file_handler_save(directory):
     assert get_contents(directory, 'test.txt') == b'contents'
 
 
+@pytest.mark.skipif(caio is None, reason='caio is not installed')
+@pytest.mark.asyncio
+async def test_caio_save_multiple_chunks(directory):
+    # Larger than the chunk size, so the caio path submits several writes
+    handler = AsyncLocalFileHandler(base_path=directory)
+    data = b'contents' * 5000
+
+    await handler.async_save_data(filename='test.txt', data=data)
+
+    assert get_contents(directory, 'test.txt') == data
+    # The caio path must create files with the same permissions the
+    # plain open() path does — in particular, not executable.
+    mode = os.stat(os.path.join(directory, 'test.txt')).st_mode & 0o777
+    with open(os.path.join(directory, 'control.txt'), 'wb') as f:
+        f.write(b'contents')
+    control = os.stat(os.path.join(directory, 'control.txt')).st_mode & 0o777
+    assert mode == control
+
+
+@pytest.mark.skipif(caio is None, reason='caio is not installed')
+def test_caio_save_across_event_loops(directory):
+    # Each asyncio.run call brings a fresh loop; the handler must not
+    # reuse a caio context bound to a dead one.
+    handler = AsyncLocalFileHandler(base_path=directory)
+
+    run(handler.async_save_data(filename='one.txt', data=b'contents'))
+    run(handler.async_save_data(filename='two.txt', data=b'contents'))
+
+    assert get_contents(directory, 'one.txt') == b'contents'
+    assert get_contents(directory, 'two.txt') == b'contents'
+
+
 @pytest.mark.asyncio
 async def test_async_local_file_handler_exists(directory):
     handler = AsyncLocalFileHandler(base_path=directory)
@@ -375,8 +412,10 @@ async def test_async_local_file_save_same_filename(directory):
     )
 
     assert first == 'test.txt'
-    assert second == 'test-1.txt'
-    assert third == 'test-2.txt'
+    # Collisions get a random suffix added to the name
+    assert re.fullmatch(r'test-[A-Za-z0-9_-]+\.txt', second)
+    assert re.fullmatch(r'test-[A-Za-z0-9_-]+\.txt', third)
+    assert second != third
 
     assert exists(directory, first)
     assert exists(directory, second)
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from datetime import datetime
 from io import BytesIO
@@ -5,250 +7,272 @@ from io import BytesIO
 from filestorage.handlers import S3Handler
 from . import s3_mock
 
+MSG_NO_ACCESSED_TIME = re.escape(
+    'get_accessed_time is not supported with the S3 handler'
+)
+MSG_NO_CREATED_TIME = re.escape(
+    'get_created_time is not supported with the S3 handler'
+)
 
-@pytest.fixture
-def mock_s3_resource(mocker):
+
+# The resource is swapped with a plain setattr rather than mocker.patch;
+# the tests only need the attribute replaced, not a recording patcher.
+# One resource serves the whole module; each test starts from a reset.
+@pytest.fixture(scope='module')
+def _shared_s3_resource():
     resource = s3_mock.MockS3AsyncResource()
-    contextualized = s3_mock.MockAsyncContext(resource)
-    mocker.patch(
-        'filestorage.handlers.S3Handler.resource',
-        new=contextualized,
-    )
-    return resource
+    original = S3Handler.resource
+    S3Handler.resource = s3_mock.MockAsyncContext(resource)
+    yield resource
+    S3Handler.resource = original
 
 
-@pytest.fixture
-def mock_s3_resource_failure(mocker):
-    resource = s3_mock.MockS3AsyncResource(make_object_missing=True)
-    contextualized = s3_mock.MockAsyncContext(resource)
-    mocker.patch(
-        'filestorage.handlers.S3Handler.resource',
-        new=contextualized,
-    )
-    return resource
+@pytest.fixture(autouse=True)
+def mock_s3_resource(_shared_s3_resource):
+    _shared_s3_resource.reset()
+    return _shared_s3_resource
 
 
 @pytest.fixture
+def mock_s3_resource_failure(mock_s3_resource):
+    mock_s3_resource.make_object_missing = True
+    return mock_s3_resource
+
+
+# The handlers hold no per-test state — everything the tests assert on
+# lives in the mocked resource — so one instance per module is enough.
+@pytest.fixture(scope='module')
 def handler():
     return S3Handler(bucket_name='bucket')
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def async_only_handler():
     return S3Handler(bucket_name='bucket', allow_sync_methods=False)
 
 
-@pytest.mark.asyncio
 async def test_validate(mock_s3_resource, handler):
     await handler.validate()
 
 
-@pytest.mark.asyncio
-async def test_async_exists(mock_s3_resource, handler):
+@pytest.mark.parametrize('pre_seeded', [False, True])
+async def test_async_exists(mock_s3_resource, handler, pre_seeded):
+    handler._etag_cache.clear()
     item = handler.get_item('foo.txt')
+    if pre_seeded:
+        handler._etag_cache[item.url_path] = s3_mock.MOCK_ETAG
 
     assert await handler._async_exists(item)
 
 
-def test_exists(mock_s3_resource, handler):
+@pytest.mark.parametrize('pre_seeded', [False, True])
+def test_exists(mock_s3_resource, handler, pre_seeded):
+    handler._etag_cache.clear()
+    item = handler.get_item('foo.txt')
+    if pre_seeded:
+        handler._etag_cache[item.url_path] = s3_mock.MOCK_ETAG
+
+    assert handler._exists(item)
+
+
+def test_exists_caches_etag(mock_s3_resource, handler):
+    handler._etag_cache.clear()
     item = handler.get_item('foo.txt')
 
     assert handler._exists(item)
+    assert handler._etag_cache[item.url_path] == s3_mock.MOCK_ETAG
+
+    # The second check sends the cached tag and accepts the 304
+    assert handler._exists(item)
+    head_kwargs = mock_s3_resource.meta.client._head_object_kwargs
+    assert head_kwargs['IfNoneMatch'] == s3_mock.MOCK_ETAG
 
 
 def test_not_exists(mock_s3_resource_failure, handler):
+    handler._etag_cache.clear()
     item = handler.get_item('foo.txt')
 
     assert not handler._exists(item)
 
 
-@pytest.mark.asyncio
-async def test_async_get_size(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt', data=BytesIO(b'contents'))
+async def test_async_get_size(mock_s3_resource, handler, contents_io):
+    item = handler.get_item('foo.txt', data=contents_io())
 
     assert await handler._async_get_size(item) == 8
 
 
-def test_get_size(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt', data=BytesIO(b'contents'))
+def test_get_size(mock_s3_resource, handler, contents_io):
+    item = handler.get_item('foo.txt', data=contents_io())
 
     assert handler._get_size(item) == 8
 
 
-@pytest.mark.asyncio
-async def test_async_get_accessed_time(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt', data=BytesIO(b'contents'))
+async def test_async_get_accessed_time(mock_s3_resource, handler, contents_io):
+    item = handler.get_item('foo.txt', data=contents_io())
 
-    with pytest.raises(NotImplementedError) as err:
+    with pytest.raises(NotImplementedError, match=MSG_NO_ACCESSED_TIME):
         await handler._async_get_accessed_time(item)
 
-    assert (
-        str(err.value)
-        == 'get_accessed_time is not supported with the S3 handler'
-    )
 
+def test_get_accessed_time(mock_s3_resource, handler, contents_io):
+    item = handler.get_item('foo.txt', data=contents_io())
 
-def test_get_accessed_time(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt', data=BytesIO(b'contents'))
-
-    with pytest.raises(NotImplementedError) as err:
+    with pytest.raises(NotImplementedError, match=MSG_NO_ACCESSED_TIME):
         handler._get_accessed_time(item)
 
-    assert (
-        str(err.value)
-        == 'get_accessed_time is not supported with the S3 handler'
-    )
-
 
-@pytest.mark.asyncio
-async def test_async_get_created_time(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt', data=BytesIO(b'contents'))
+async def test_async_get_created_time(mock_s3_resource, handler, contents_io):
+    item = handler.get_item('foo.txt', data=contents_io())
 
-    with pytest.raises(NotImplementedError) as err:
+    with pytest.raises(NotImplementedError, match=MSG_NO_CREATED_TIME):
         await handler._async_get_created_time(item)
 
-    assert (
-        str(err.value)
-        == 'get_created_time is not supported with the S3 handler'
-    )
-
 
-def test_get_created_time(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt', data=BytesIO(b'contents'))
+def test_get_created_time(mock_s3_resource, handler, contents_io):
+    item = handler.get_item('foo.txt', data=contents_io())
 
-    with pytest.raises(NotImplementedError) as err:
+    with pytest.raises(NotImplementedError, match=MSG_NO_CREATED_TIME):
         handler._get_created_time(item)
 
-    assert (
-        str(err.value)
-        == 'get_created_time is not supported with the S3 handler'
-    )
-
 
-@pytest.mark.asyncio
-async def test_async_get_modified_time(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt', data=BytesIO(b'contents'))
+async def test_async_get_modified_time(mock_s3_resource, handler, contents_io):
+    item = handler.get_item('foo.txt', data=contents_io())
 
     assert await handler._async_get_modified_time(item) == datetime(2015, 1, 1)
 
 
-def test_get_modified_time(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt', data=BytesIO(b'contents'))
+def test_get_modified_time(mock_s3_resource, handler, contents_io):
+    item = handler.get_item('foo.txt', data=contents_io())
 
     assert handler._get_modified_time(item) == datetime(2015, 1, 1)
 
 
-@pytest.mark.asyncio
-async def test_async_save(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt', data=BytesIO(b'contents'))
+async def test_async_save(mock_s3_resource, handler, contents_io):
+    item = handler.get_item('foo.txt', data=contents_io())
 
     await handler._async_save(item)
 
     call_args = mock_s3_resource._bucket._upload_fileobj_call_args
-    assert call_args == {
-        'ExtraArgs': {'ACL': 'public-read', 'ContentType': 'text/plain'}
+    assert call_args['ExtraArgs'] == {
+        'ACL': 'public-read',
+        'ContentType': 'text/plain',
     }
 
 
-def test_save(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt', data=BytesIO(b'contents'))
+def test_save(mock_s3_resource, handler, contents_io):
+    item = handler.get_item('foo.txt', data=contents_io())
 
     handler._save(item)
 
     call_args = mock_s3_resource._bucket._upload_fileobj_call_args
-    assert call_args == {
-        'ExtraArgs': {'ACL': 'public-read', 'ContentType': 'text/plain'}
+    assert call_args['ExtraArgs'] == {
+        'ACL': 'public-read',
+        'ContentType': 'text/plain',
     }
 
 
-@pytest.mark.asyncio
-async def test_async_delete(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt')
-
-    await handler._async_delete(item)
-
-    assert mock_s3_resource._file_object._deleted
-
+def test_connection_pool_options():
+    pooled = S3Handler(bucket_name='bucket', max_pool_connections=30)
 
-def test_delete(mock_s3_resource, handler):
-    item = handler.get_item('foo.txt')
+    assert pooled.aio_config_params['max_pool_connections'] == 30
 
-    handler._delete(item)
 
-    assert mock_s3_resource._file_object._deleted
-
-
-# When allow_sync_methods is False, these should all throw a RuntimeError
+async def test_upload_uses_transfer_config(
+    mock_s3_resource, handler, contents_io
+):
+    item = handler.get_item('foo.txt', data=contents_io())
 
+    await handler._async_save(item)
 
-def test_cant_save(async_only_handler):
-    item = async_only_handler.get_item('foo.txt', data=BytesIO(b'contents'))
+    call_args = mock_s3_resource._bucket._upload_fileobj_call_args
+    assert call_args['Config'] is handler._transfer_config
 
-    with pytest.raises(RuntimeError) as err:
-        async_only_handler._save(item)
 
-    assert str(err.value) == 'Sync save method not allowed'
+class ChunkOnlyStream:
+    """A stream that refuses to be read all at once."""
 
+    def __init__(self, payload: bytes):
+        self._data = BytesIO(payload)
 
-def test_cant_exists(async_only_handler):
-    item = async_only_handler.get_item('foo.txt', data=BytesIO(b'contents'))
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            raise AssertionError('the entire stream was read into memory')
+        return self._data.read(size)
 
-    with pytest.raises(RuntimeError) as err:
-        async_only_handler._exists(item)
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._data.seek(offset, whence)
 
-    assert str(err.value) == 'Sync exists method not allowed'
 
+async def test_save_does_not_read_entire_stream(mock_s3_resource, handler):
+    # The handler must hand the stream to upload_fileobj for chunked
+    # consumption rather than buffering the whole object itself.
+    item = handler.get_item('foo.txt', data=ChunkOnlyStream(b'contents'))
 
-def test_cant_get_size(async_only_handler):
-    item = async_only_handler.get_item('foo.txt', data=BytesIO(b'contents'))
+    await handler._async_save(item)
 
-    with pytest.raises(RuntimeError) as err:
-        async_only_handler._get_size(item)
+    assert mock_s3_resource._bucket._upload_fileobj_filename == 'foo.txt'
 
-    assert str(err.value) == 'Sync get_size method not allowed'
 
+async def test_async_save_many(mock_s3_resource, handler, contents_io):
+    files = [
+        ('one.txt', contents_io()),
+        ('two.txt', contents_io()),
+        ('three.txt', contents_io()),
+    ]
 
-def test_cant_get_accessed_time(async_only_handler):
-    item = async_only_handler.get_item('foo.txt', data=BytesIO(b'contents'))
+    saved = await handler.async_save_many(files)
 
-    with pytest.raises(RuntimeError) as err:
-        async_only_handler._get_accessed_time(item)
+    assert saved == ['one.txt', 'two.txt', 'three.txt']
+    calls = mock_s3_resource._bucket._upload_fileobj_calls
+    assert sorted(filename for filename, _ in calls) == [
+        'one.txt',
+        'three.txt',
+        'two.txt',
+    ]
 
-    assert str(err.value) == 'Sync get_accessed_time method not allowed'
 
+async def test_async_delete(mock_s3_resource, handler):
+    item = handler.get_item('foo.txt')
 
-def test_cant_get_created_time(async_only_handler):
-    item = async_only_handler.get_item('foo.txt', data=BytesIO(b'contents'))
+    await handler._async_delete(item)
 
-    with pytest.raises(RuntimeError) as err:
-        async_only_handler._get_created_time(item)
+    assert mock_s3_resource._file_object._deleted
 
-    assert str(err.value) == 'Sync get_created_time method not allowed'
 
+def test_delete(mock_s3_resource, handler):
+    item = handler.get_item('foo.txt')
 
-def test_cant_get_modified_time(async_only_handler):
-    item = async_only_handler.get_item('foo.txt', data=BytesIO(b'contents'))
+    handler._delete(item)
 
-    with pytest.raises(RuntimeError) as err:
-        async_only_handler._get_modified_time(item)
+    assert mock_s3_resource._file_object._deleted
 
-    assert str(err.value) == 'Sync get_modified_time method not allowed'
 
+# When allow_sync_methods is False, these should all throw a RuntimeError
 
-def test_cant_delete(async_only_handler):
-    item = async_only_handler.get_item('foo.txt', data=BytesIO(b'contents'))
 
-    with pytest.raises(RuntimeError) as err:
-        async_only_handler._delete(item)
+@pytest.mark.parametrize(
+    ('method', 'message'),
+    [
+        ('_save', 'Sync save method not allowed'),
+        ('_exists', 'Sync exists method not allowed'),
+        ('_get_size', 'Sync get_size method not allowed'),
+        ('_get_accessed_time', 'Sync get_accessed_time method not allowed'),
+        ('_get_created_time', 'Sync get_created_time method not allowed'),
+        ('_get_modified_time', 'Sync get_modified_time method not allowed'),
+        ('_delete', 'Sync delete method not allowed'),
+    ],
+)
+def test_cant_use_sync_method(
+    async_only_handler, method, message, contents_io
+):
+    item = async_only_handler.get_item('foo.txt', data=contents_io())
 
-    assert str(err.value) == 'Sync delete method not allowed'
+    with pytest.raises(RuntimeError, match=re.escape(message)):
+        getattr(async_only_handler, method)(item)
 
 
-@pytest.mark.asyncio
-async def test_async_save_in_folder(mock_s3_resource, handler):
-    item = handler.get_item(
-        'foo.txt', data=BytesIO(b'contents'), subpath=('folder',)
-    )
+async def test_async_save_in_folder(mock_s3_resource, handler, contents_io):
+    item = handler.get_item('foo.txt', data=contents_io(), subpath=('folder',))
 
     await handler._async_save(item)
 
@@ -257,7 +281,6 @@ async def test_async_save_in_folder(mock_s3_resource, handler):
     )
 
 
-@pytest.mark.asyncio
 async def test_async_delete_in_folder(mock_s3_resource, handler):
     item = handler.get_item('foo.txt', subpath=('folder',))
 
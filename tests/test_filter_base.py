@@ -1,8 +1,12 @@
+import re
+
 import pytest
 
 from filestorage import FileItem, FilterBase, AsyncFilterBase
 from filestorage.handlers import DummyHandler, AsyncDummyHandler
 
+MSG_FAILED_FILTER = re.escape('called a FailedFilter')
+
 
 class SimpleFilter(FilterBase):
     async_ok = True
@@ -28,9 +32,17 @@ class AsyncFailedFilter(AsyncFilterBase):
         raise RuntimeError('called a FailedFilter')
 
 
-@pytest.mark.parametrize('Filter', [SimpleFilter, AsyncSimpleFilter])
-def test_sync_filter_call(Filter):
-    handler = DummyHandler(filters=[Filter()])
+# The filters are stateless, so each parametrize case reuses one
+# module-level instance instead of constructing its own.
+SIMPLE_FILTER = SimpleFilter()
+FAILED_FILTER = FailedFilter()
+ASYNC_SIMPLE_FILTER = AsyncSimpleFilter()
+ASYNC_FAILED_FILTER = AsyncFailedFilter()
+
+
+@pytest.mark.parametrize('filter_inst', [SIMPLE_FILTER, ASYNC_SIMPLE_FILTER])
+def test_sync_filter_call(filter_inst):
+    handler = DummyHandler(filters=(filter_inst,))
 
     handler.save_data(data=b'contents', filename='file.txt')
 
@@ -40,20 +52,18 @@ def test_sync_filter_call(Filter):
         assert f.read() == b'contents'
 
 
-@pytest.mark.parametrize('Filter', [FailedFilter, AsyncFailedFilter])
-def test_sync_filter_bad_call(Filter):
-    handler = DummyHandler(filters=[Filter()])
+@pytest.mark.parametrize('filter_inst', [FAILED_FILTER, ASYNC_FAILED_FILTER])
+def test_sync_filter_bad_call(filter_inst):
+    handler = DummyHandler(filters=(filter_inst,))
 
-    with pytest.raises(RuntimeError) as err:
+    with pytest.raises(RuntimeError, match=MSG_FAILED_FILTER):
         handler.save_data(data=b'contents', filename='file.txt')
 
-    assert str(err.value) == 'called a FailedFilter'
-
 
-@pytest.mark.parametrize('Filter', [SimpleFilter, AsyncSimpleFilter])
+@pytest.mark.parametrize('filter_inst', [SIMPLE_FILTER, ASYNC_SIMPLE_FILTER])
 @pytest.mark.asyncio
-async def test_async_filter_call(Filter):
-    handler = AsyncDummyHandler(filters=[Filter()])
+async def test_async_filter_call(filter_inst):
+    handler = AsyncDummyHandler(filters=(filter_inst,))
 
     await handler.async_save_data(data=b'contents', filename='file.txt')
 
@@ -63,12 +73,10 @@ async def test_async_filter_call(Filter):
         assert f.read() == b'contents'
 
 
-@pytest.mark.parametrize('Filter', [FailedFilter, AsyncFailedFilter])
+@pytest.mark.parametrize('filter_inst', [FAILED_FILTER, ASYNC_FAILED_FILTER])
 @pytest.mark.asyncio
-async def test_async_filter_bad_call(Filter):
-    handler = AsyncDummyHandler(filters=[Filter()])
+async def test_async_filter_bad_call(filter_inst):
+    handler = AsyncDummyHandler(filters=(filter_inst,))
 
-    with pytest.raises(RuntimeError) as err:
+    with pytest.raises(RuntimeError, match=MSG_FAILED_FILTER):
         await handler.async_save_data(data=b'contents', filename='file.txt')
-
-    assert str(err.value) == 'called a FailedFilter'
@@ -1,5 +1,4 @@
-import cgi
-from asyncio import Future, isfuture
+from asyncio import isfuture, new_event_loop
 from io import BytesIO
 
 import pytest
@@ -9,6 +8,9 @@ from filestorage import FileItem, StorageContainer, FilterBase
 from filestorage.exceptions import FilestorageConfigError
 from filestorage.handlers import DummyHandler, AsyncDummyHandler
 
+# One bytes literal shared by every save/delete round-trip below.
+PAYLOAD = b'contents'
+
 
 @pytest.fixture
 def store():
@@ -20,21 +22,30 @@ def handler():
     return DummyHandler()
 
 
-def test_different_paths():
-    handlers = [
-        DummyHandler(path=('foo',)),
-        DummyHandler(path=('foo')),
-        DummyHandler(path=['foo']),
-        DummyHandler(path='foo'),
-    ]
+# Every accepted spelling of a handler path normalizes to one tuple.
+PATH_INPUTS = [('foo',), ('foo'), ['foo'], 'foo']
+
+
+@pytest.mark.parametrize('path', PATH_INPUTS)
+def test_different_paths(path):
+    assert DummyHandler(path=path).path == ('foo',)
+
+
+# One pair of filter mocks serves every validate test; the fixture
+# resets them instead of paying Mock construction per test.
+_FILTER_A, _FILTER_B = Mock(), Mock()
+
 
-    for handler in handlers:
-        assert handler.path == ('foo',)
+@pytest.fixture
+def filter_pair():
+    for mock in (_FILTER_A, _FILTER_B):
+        mock.reset_mock(return_value=True, side_effect=True)
+        mock.async_ok = True
+    return _FILTER_A, _FILTER_B
 
 
-def test_validate():
-    filter1 = Mock()
-    filter2 = Mock()
+def test_validate(filter_pair):
+    filter1, filter2 = filter_pair
     handler = DummyHandler(filters=[filter1, filter2])
 
     validate_result = handler.validate()
@@ -45,9 +56,12 @@ def test_validate():
     filter2.validate.assert_called()
 
 
-def test_validate_async_filter():
-    filter1 = Mock()
-    filter1.validate.return_value = Future()
+def test_validate_async_filter(filter_pair):
+    # The future is created on a dedicated loop; a bare Future() depends
+    # on a current event loop being set, which isn't guaranteed here.
+    loop = new_event_loop()
+    filter1, _ = filter_pair
+    filter1.validate.return_value = loop.create_future()
     handler = DummyHandler(filters=[filter1])
 
     validate_result = handler.validate()
@@ -55,6 +69,7 @@ def test_validate_async_filter():
     assert isfuture(validate_result)
     assert handler.validated
     filter1.validate.assert_called()
+    loop.close()
 
 
 @pytest.mark.asyncio
@@ -66,11 +81,18 @@ async def test_validate_async_handler():
     assert handler.validated
 
 
+class _BadAsyncFilter:
+    # A plain stub is far cheaper to build than a Mock, and this test
+    # only needs async_ok read — it never asserts on calls.
+    async_ok = False
+
+    def validate(self):
+        pass
+
+
 @pytest.mark.asyncio
 async def test_validate_bad_async_filter():
-    filter1 = Mock()
-    filter1.async_ok = False
-    handler = AsyncDummyHandler(filters=[filter1])
+    handler = AsyncDummyHandler(filters=[_BadAsyncFilter()])
 
     with pytest.raises(FilestorageConfigError) as err:
         await handler.validate()
@@ -86,21 +108,23 @@ def test_get_item():
     assert item == FileItem(filename='file.txt', path=('foo',))
 
 
-@pytest.mark.parametrize(
-    ('dirty', 'clean'),
-    [
-        ['..foo', 'foo'],
-        ['foo..', 'foo..'],
-        ['../foo', '_foo'],
-        ['/.foo', '_.foo'],
-        ['a b c', 'a_b_c'],
-        ['a/b/c', 'a_b_c'],
-        ['1/2/3', '1_2_3'],
-        ['☺', '_'],
-    ],
-)
-def test_sanitize_filename(handler, dirty, clean):
-    assert handler.sanitize_filename(dirty) == clean
+SANITIZE_CASES = [
+    ('..foo', 'foo'),
+    ('foo..', 'foo..'),
+    ('../foo', '_foo'),
+    ('/.foo', '_.foo'),
+    ('a b c', 'a_b_c'),
+    ('a/b/c', 'a_b_c'),
+    ('1/2/3', '1_2_3'),
+    ('☺', '_'),
+]
+
+
+def test_sanitize_filename(handler):
+    # A plain loop over the table shares one handler across every case
+    # instead of rebuilding the fixture eight times.
+    for dirty, clean in SANITIZE_CASES:
+        assert handler.sanitize_filename(dirty) == clean, dirty
 
 
 def test_get_url():
@@ -110,69 +134,101 @@ def test_get_url():
 
 
 def test_get_size(handler):
-    handler.save_data(data=b'contents', filename='file.txt')
+    handler.save_data(data=PAYLOAD, filename='file.txt')
 
     item_size = handler.last_save_contents
     assert len(item_size) == handler.get_size('file.txt')
 
 
 def test_get_accessed_time(handler):
-    handler.save_data(data=b'contents', filename='file.txt')
+    handler.save_data(data=PAYLOAD, filename='file.txt')
 
     atime = handler.files['file.txt'].atime
     assert atime == handler.get_accessed_time('file.txt')
 
 
 def test_get_created_time(handler):
-    handler.save_data(data=b'contents', filename='file.txt')
+    handler.save_data(data=PAYLOAD, filename='file.txt')
 
     ctime = handler.files['file.txt'].ctime
     assert ctime == handler.get_created_time('file.txt')
 
 
 def test_get_modified_time(handler):
-    handler.save_data(data=b'contents', filename='file.txt')
+    handler.save_data(data=PAYLOAD, filename='file.txt')
 
     mtime = handler.files['file.txt'].mtime
     assert mtime == handler.get_modified_time('file.txt')
 
 
 def test_save_file(handler):
-    handler.save_data(data=b'contents', filename='file.txt')
+    handler.save_data(data=PAYLOAD, filename='file.txt')
 
     item = handler.last_save
     assert item.filename == 'file.txt'
     with item as f:
-        assert f.read() == b'contents'
+        assert f.read() == PAYLOAD
 
 
 @pytest.mark.asyncio
 async def test_async_save_file():
     handler = AsyncDummyHandler()
-    await handler.async_save_data(data=b'contents', filename='file.txt')
+    await handler.async_save_data(data=PAYLOAD, filename='file.txt')
 
     item = handler.last_save
     assert item.filename == 'file.txt'
     with item as f:
-        assert f.read() == b'contents'
+        assert f.read() == PAYLOAD
+
+
+def test_save_many(handler):
+    saved = handler.save_many(
+        [
+            ('one.txt', BytesIO(b'contents one')),
+            ('two.txt', BytesIO(b'contents two')),
+        ]
+    )
+
+    assert saved == ['one.txt', 'two.txt']
+    assert handler.exists('one.txt')
+    assert handler.exists('two.txt')
+
+
+@pytest.mark.asyncio
+async def test_async_save_many():
+    handler = AsyncDummyHandler()
+
+    saved = await handler.async_save_many(
+        [
+            ('one.txt', BytesIO(b'contents one')),
+            ('two.txt', BytesIO(b'contents two')),
+        ]
+    )
+
+    assert saved == ['one.txt', 'two.txt']
+    assert await handler.async_exists('one.txt')
+    assert await handler.async_exists('two.txt')
 
 
 def test_save_field(handler):
-    headers = {'content-disposition': 'attachment; filename=file.txt'}
-    field = cgi.FieldStorage(headers=headers)
-    field.file = BytesIO(b'contents')
-    handler.save_field(field)
+    # A tiny stand-in for cgi.FieldStorage; the cgi module is deprecated
+    # and save_field only reads the filename and file attributes.
+    class Field:
+        filename = 'file.txt'
+        file = BytesIO(PAYLOAD)
+
+    handler.save_field(Field())
 
     item = handler.last_save
     assert item.filename == 'file.txt'
     with item as f:
-        assert f.read() == b'contents'
+        assert f.read() == PAYLOAD
 
 
 def test_delete_file(handler):
     assert not handler.exists('file.txt')
 
-    handler.save_data(data=b'contents', filename='file.txt')
+    handler.save_data(data=PAYLOAD, filename='file.txt')
     assert handler.exists('file.txt')
 
     handler.delete('file.txt')
@@ -184,7 +240,7 @@ async def test_async_delete_file():
     handler = AsyncDummyHandler()
     assert not await handler.async_exists('file.txt')
 
-    await handler.async_save_data(data=b'contents', filename='file.txt')
+    await handler.async_save_data(data=PAYLOAD, filename='file.txt')
     assert await handler.async_exists('file.txt')
 
     await handler.async_delete('file.txt')
@@ -195,13 +251,13 @@ def test_subfolder_save(store, handler):
     store.handler = handler
     subfolder = store / 'a' / 'b'
 
-    subfolder.save_data(data=b'contents', filename='file.txt')
+    subfolder.save_data(data=PAYLOAD, filename='file.txt')
 
     item = handler.last_save
     assert item.filename == 'file.txt'
     assert item.path == ('a', 'b')
     with item as f:
-        assert f.read() == b'contents'
+        assert f.read() == PAYLOAD
 
 
 def test_subfolder_delete_file(store, handler):
@@ -209,7 +265,7 @@ def test_subfolder_delete_file(store, handler):
     subfolder = store / 'a' / 'b'
     assert not subfolder.exists('file.txt')
 
-    subfolder.save_data(data=b'contents', filename='file.txt')
+    subfolder.save_data(data=PAYLOAD, filename='file.txt')
     assert subfolder.exists('file.txt')
 
     subfolder.delete('file.txt')
@@ -231,7 +287,7 @@ def test_calls_filter(store):
     filter1 = MockFilter('-1')
     filter2 = MockFilter('-2')
     store.handler = DummyHandler(filters=[filter1, filter2])
-    result = store.save_data(data=b'contents', filename='file.txt')
+    result = store.save_data(data=PAYLOAD, filename='file.txt')
 
     filter1.mock._apply.assert_called()
     filter2.mock._apply.assert_called()
@@ -1,5 +1,7 @@
 from typing import Dict
 
+import pytest
+
 from filestorage import store, pyramid_config, StorageContainer
 
 
@@ -30,14 +32,41 @@ class MockPyramidConfig:
         return self._request_methods[name](very_dummy_request)
 
 
-def test_pyramid_includeme():
-    settings = {
+SETTINGS = {
+    'default': {
         'store.use_global': 'false',
         'store.handler': 'DummyHandler',
         'store.handler.base_url': 'http://foo.bar',
-    }
-    config = MockPyramidConfig(settings)
-    pyramid_config.includeme(config)
+    },
+    'renamed': {
+        'store.use_global': 'false',
+        'store.request_property': 'my_store',
+        'store.handler': 'DummyHandler',
+        'store.handler.base_url': 'http://foo.bar',
+    },
+    'none': {},
+}
+
+
+# Each settings set is built and run through includeme once for the
+# whole module; the configs hand out their store without further setup.
+@pytest.fixture(scope='module')
+def pyramid_ctx():
+    cache: Dict[str, MockPyramidConfig] = {}
+
+    def get(name: str) -> MockPyramidConfig:
+        config = cache.get(name)
+        if config is None:
+            config = MockPyramidConfig(SETTINGS[name])
+            pyramid_config.includeme(config)
+            cache[name] = config
+        return config
+
+    return get
+
+
+def test_pyramid_includeme(pyramid_ctx):
+    config = pyramid_ctx('default')
 
     pyramid_store = config.get_request_prop('store')
     assert store is not pyramid_store
@@ -45,15 +74,8 @@ def test_pyramid_includeme():
     assert pyramid_store.base_url == 'http://foo.bar'
 
 
-def test_pyramid_different_prop_name():
-    settings = {
-        'store.use_global': 'false',
-        'store.request_property': 'my_store',
-        'store.handler': 'DummyHandler',
-        'store.handler.base_url': 'http://foo.bar',
-    }
-    config = MockPyramidConfig(settings)
-    pyramid_config.includeme(config)
+def test_pyramid_different_prop_name(pyramid_ctx):
+    config = pyramid_ctx('renamed')
 
     pyramid_store = config.get_request_prop('my_store')
     assert store is not pyramid_store
@@ -61,26 +83,18 @@ def test_pyramid_different_prop_name():
     assert pyramid_store.base_url == 'http://foo.bar'
 
 
-def test_pyramid_no_config():
-    settings = {}
-
-    config = MockPyramidConfig(settings)
-    pyramid_config.includeme(config)
+def test_pyramid_no_config(pyramid_ctx):
+    config = pyramid_ctx('none')
 
     pyramid_store = config.get_request_prop('store')
     assert store is pyramid_store
     assert pyramid_store.finalized is False
 
 
-def test_pyramid_local_store():
-    # Setup two stores and ensure they're different.
-    settings = {
-        'store.use_global': 'false',
-        'store.handler': 'DummyHandler',
-    }
-    config1 = MockPyramidConfig(settings)
-    pyramid_config.includeme(config1)
-    config2 = MockPyramidConfig(settings)
+def test_pyramid_local_store(pyramid_ctx):
+    # Two configs from the same settings must yield different stores.
+    config1 = pyramid_ctx('default')
+    config2 = MockPyramidConfig(SETTINGS['default'])
     pyramid_config.includeme(config2)
 
     pyramid_store1 = config1.get_request_prop('store')
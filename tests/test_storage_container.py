@@ -1,4 +1,4 @@
-from asyncio import Future
+from asyncio import get_running_loop
 
 import pytest
 from mock import Mock
@@ -13,17 +13,42 @@ def store():
     return StorageContainer()
 
 
+# Assigning a handler to a store writes handler_name onto the instance,
+# so every test that takes a handler mutates it. The factory is shared
+# at module scope; each test draws a fresh instance from it.
+@pytest.fixture(scope='module')
+def make_handler():
+    def make() -> DummyHandler:
+        return DummyHandler(base_url='http://eppx.com/', path=('static',))
+
+    return make
+
+
 @pytest.fixture
-def handler(store):
-    return DummyHandler(base_url='http://eppx.com/', path=('static',))
+def handler(make_handler):
+    return make_handler()
+
+
+def _resolved_future():
+    # Validation gathers this future, and gather refuses futures that
+    # belong to another loop — so it's built on the loop doing the
+    # validating rather than shared across tests.
+    future = get_running_loop().create_future()
+    future.set_result(None)
+    return future
+
+
+# A single validate mock is shared across tests and reset by the
+# fixture, saving a Mock construction per test.
+_VALIDATE_MOCK = Mock()
 
 
 @pytest.fixture
-def async_handler(store):
+def async_handler():
     handler = AsyncDummyHandler()
-    handler.validate = Mock()
-    handler.validate.return_value = Future()
-    handler.validate.return_value.set_result(None)
+    _VALIDATE_MOCK.reset_mock(return_value=True, side_effect=True)
+    _VALIDATE_MOCK.side_effect = _resolved_future
+    handler.validate = _VALIDATE_MOCK
     return handler
 
 
@@ -92,6 +117,33 @@ async def test_async_validate_error(store, async_handler):
     )
 
 
+def test_populate_handler_methods(store, handler):
+    """Finalizing binds the handler's methods directly onto the store."""
+    store.handler = handler
+    store.finalize_config()
+
+    assert store.save_data == handler.save_data
+    assert store.exists == handler.exists
+    assert store.delete == handler.delete
+
+    store.save_data(filename='new_file.txt', data=b'As a cucumber.')
+
+    assert handler.last_save.filename == 'new_file.txt'
+
+
+def test_double_handler_setting(store, handler, make_handler):
+    other = make_handler()
+    store.handler = handler
+    store.handler = other
+
+    assert store.handler is other
+
+    store.finalize_config()
+
+    assert other.validated
+    assert not handler.validated
+
+
 def test_child_stores_naming(store):
     sub_a = store['a']
     sub_b = store['a']['b']
@@ -135,6 +187,26 @@ def test_bad_handler_setting(store):
     )
 
 
+def test_get_url_unchanged_by_finalizing(store, handler):
+    store.handler = handler
+
+    url = store.get_url('file.txt')
+    store.finalize_config()
+
+    assert url == 'http://eppx.com/file.txt'
+    assert store.get_url('file.txt') == url
+
+
+def test_handler_class_not_instance(store):
+    with pytest.raises(FilestorageConfigError) as err:
+        store.handler = DummyHandler
+
+    assert str(err.value) == (
+        'Setting store.handler: DummyHandler is a class, not an instance. '
+        'Did you mean to use "store.handler = DummyHandler()" instead?'
+    )
+
+
 def test_finalized_without_setting(store):
     with pytest.raises(FilestorageConfigError) as err:
         store.finalize_config()